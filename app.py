@@ -29,8 +29,10 @@ def get_page_count(module_path: str) -> Optional[int]:
     """
     Retrieve the number of items in a page's dataframe.
 
-    Dynamically imports the specified module and attempts to access its
-    dataframe attribute to count the number of items.
+    Dynamically imports the specified module and takes the row count from
+    its get_table_shape function, which reads it without loading the
+    page's DataFrame, or counts the items of its dataframe attribute for
+    pages that still load their data at import.
 
     Args:
         module_path (str): The dot-notation path to the module to import
@@ -41,6 +43,8 @@ def get_page_count(module_path: str) -> Optional[int]:
     """
     try:
         module = importlib.import_module(module_path)
+        if hasattr(module, 'get_table_shape'):
+            return module.get_table_shape()[1]
         if hasattr(module, 'dataframe'):
             return len(module.dataframe)
     except (ImportError, AttributeError):
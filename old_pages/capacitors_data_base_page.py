@@ -81,11 +81,11 @@ visible_columns = [
     col for col in dataframe.columns if col not in hidden_columns]
 
 try:
-    dataframe['Datasheet'] = dataframe['Datasheet'].apply(
-        lambda url_text: dcu.generate_centered_link(url_text, "Datasheet"))
+    dataframe['Datasheet'] = dcu.generate_centered_links(
+        dataframe['Datasheet'], "Datasheet")
 
-    dataframe['Trustedparts Search'] = dataframe['Trustedparts Search'].apply(
-        lambda url_text: dcu.generate_centered_link(url_text, "Search"))
+    dataframe['Trustedparts Search'] = dcu.generate_centered_links(
+        dataframe['Trustedparts Search'], "Search")
 except KeyError:
     pass
 
@@ -143,7 +143,7 @@ layout = dbc.Container([html.Div([
 dcu.callback_update_visible_columns(
     f'{module_name}_table',
     f'{module_name}_column_toggle',
-    dataframe)
+    lambda: dataframe)
 
 dcu.callback_update_table_style_and_visibility(f'{module_name}_table')
 
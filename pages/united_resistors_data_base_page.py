@@ -20,6 +20,8 @@ Bootstrap components for a polished user interface and includes
 comprehensive styling support for both light and dark themes.
 """
 
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 import dash_bootstrap_components as dbc
 from dash import html, dcc, register_page
 from dash import dash_table
@@ -33,17 +35,53 @@ module_name = __name__.rsplit(".", maxsplit=1)[-1]
 
 register_page(__name__, name=link_name, order=3)
 
-dataframe: pd.DataFrame = pd.read_csv('data/UNITED_RESISTORS_DATA_BASE.csv')
-total_rows = len(dataframe)
+DATABASE_CSV = 'data/UNITED_RESISTORS_DATA_BASE.csv'
+
+# Column types of the database CSV, declared so parsing skips inference
+DTYPES: Dict[str, Any] = {
+    'Symbol Name': str,
+    'Reference': str,
+    'Value': str,
+    'Footprint': str,
+    'Datasheet': str,
+    'Description': str,
+    'Manufacturer': str,
+    'MPN': str,
+    'Tolerance': str,
+    'Voltage Rating': str,
+    'Case Code - in': 'int64',
+    'Case Code - mm': 'int64',
+    'Series': str,
+    'Trustedparts Search': str
+}
+
+
+@lru_cache(maxsize=1)
+def get_dataframe() -> pd.DataFrame:
+    """Load the resistors database, with its links wrapped for display.
+
+    Called on first use rather than at import, so starting the app does
+    not read every page's CSV; later calls return the cached DataFrame.
+
+    Returns:
+        pd.DataFrame: The database shown in the page's table.
+    """
+    return dcu.load_dataframe(
+        DATABASE_CSV, dtype=DTYPES,
+        links={'Datasheet': "Datasheet", 'Trustedparts Search': "Search"})
+
+
+def get_table_shape() -> Tuple[List[str], int]:
+    """Return the resistors database's column names and row count.
+
+    Reads the Parquet sidecar's metadata or scans the CSV rows, without
+    loading the DataFrame.
+
+    Returns:
+        Tuple[List[str], int]: The column names and the number of rows.
+    """
+    return dcu.read_table_shape(DATABASE_CSV)
 
-TITLE = f"Resistors Database ({total_rows:,} items)"
-ABOUT = (
-    "The Resistors Database is an interactive web application that "
-    "provides a comprehensive view of resistor specifications.",
-    "It allows users to easily browse, search, and filter "
-    f"through a database of {total_rows:,} resistors, "
-    "providing quick access to important information and datasheets."
-)
 
 features = [
     "Interactive data table displaying resistor specifications",
@@ -78,80 +116,96 @@ hidden_columns = [
     'Series'
 ]
 
-visible_columns = [
-    col for col in dataframe.columns if col not in hidden_columns]
-
-try:
-    dataframe['Datasheet'] = dataframe['Datasheet'].apply(
-        lambda url_text: dcu.generate_centered_link(url_text, "Datasheet"))
-
-    dataframe['Trustedparts Search'] = dataframe['Trustedparts Search'].apply(
-        lambda url_text: dcu.generate_centered_link(url_text, "Search"))
-except KeyError:
-    pass
-
-layout = dbc.Container([html.Div([
-    dbc.Row([dbc.Col([dcc.Link("Go back Home", href="/")])]),
-    dbc.Row([dbc.Col([html.H3(
-        f"{link_name.replace('_', ' ')} ({total_rows:,} items)",
-        style=styles.heading_3_style)])]),
-    dbc.Row([dcu.app_description(TITLE, ABOUT, features, usage_steps)]),
-
-
-    dbc.Row([
-        dbc.Col([
-            html.Div([
-                html.H6("Items per page:", className="mb-1"),
-                dcc.Dropdown(
-                    id=f'{module_name}_page_size',
-                    options=[
-                        {'label': str(page_size), 'value': page_size}
-                        for page_size in [10, 25, 50, 100]
-                    ],
-                    value=10,
-                    clearable=False,
-                ),
-                html.Br()
-            ], className="d-flex flex-column align-items-start")
-        ], xs=12, sm=2),
-
-        dbc.Col([
-            html.Div([
-                html.H6("Show/Hide Columns:", className="mb-1"),
-                dbc.Checklist(
-                    id=f'{module_name}_column_toggle',
-                    options=[
-                        {"label": " ".join(col.split()), "value": col}
-                        for col in dataframe.columns
-                    ],
-                    value=visible_columns,
-                    inline=True,
-                    className="flex-wrap",
-                ),
-                html.Br()
-            ])
-        ], xs=12, sm=10),
-    ], className="mb-1"),
-
-    dash_table.DataTable(
-        id=f'{module_name}_table',
-        columns=dcu.create_column_definitions(dataframe, visible_columns),
-        data=dataframe[visible_columns].to_dict('records'),
-        cell_selectable=False,
-        markdown_options={'html': True},
-        page_size=10,
-        filter_action="native",
-        sort_action="native",
-        sort_mode="multi"),
-
-], style=styles.GLOBAL_STYLE)
-], fluid=True)
+
+def layout(**_kwargs) -> dbc.Container:
+    """Build the page layout from the database's shape.
+
+    The layout only needs the column names and row count, so rendering it,
+    including when Dash builds its validation layout from every page, does
+    not load the database; the table's callbacks load it to fill the rows.
+
+    Args:
+        **_kwargs: Query string parameters passed by Dash, unused.
+
+    Returns:
+        dbc.Container: The page content.
+    """
+    column_names, total_rows = get_table_shape()
+
+    title = f"Resistors Database ({total_rows:,} items)"
+    about = (
+        "The Resistors Database is an interactive web application that "
+        "provides a comprehensive view of resistor specifications.",
+        "It allows users to easily browse, search, and filter "
+        f"through a database of {total_rows:,} resistors, "
+        "providing quick access to important information and datasheets."
+    )
+
+    visible_columns = [
+        col for col in column_names if col not in hidden_columns]
+
+    return dbc.Container([html.Div([
+        dbc.Row([dbc.Col([dcc.Link("Go back Home", href="/")])]),
+        dbc.Row([dbc.Col([html.H3(
+            f"{link_name.replace('_', ' ')} ({total_rows:,} items)",
+            style=styles.heading_3_style)])]),
+        dbc.Row([dcu.app_description(title, about, features, usage_steps)]),
+
+
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    html.H6("Items per page:", className="mb-1"),
+                    dcc.Dropdown(
+                        id=f'{module_name}_page_size',
+                        options=[
+                            {'label': str(page_size), 'value': page_size}
+                            for page_size in [10, 25, 50, 100]
+                        ],
+                        value=10,
+                        clearable=False,
+                    ),
+                    html.Br()
+                ], className="d-flex flex-column align-items-start")
+            ], xs=12, sm=2),
+
+            dbc.Col([
+                html.Div([
+                    html.H6("Show/Hide Columns:", className="mb-1"),
+                    dbc.Checklist(
+                        id=f'{module_name}_column_toggle',
+                        options=[
+                            {"label": " ".join(col.split()), "value": col}
+                            for col in column_names
+                        ],
+                        value=visible_columns,
+                        inline=True,
+                        className="flex-wrap",
+                    ),
+                    html.Br()
+                ])
+            ], xs=12, sm=10),
+        ], className="mb-1"),
+
+        dash_table.DataTable(
+            id=f'{module_name}_table',
+            columns=dcu.create_column_definitions(
+                column_names, visible_columns),
+            cell_selectable=False,
+            markdown_options={'html': True},
+            page_size=10,
+            filter_action="native",
+            sort_action="native",
+            sort_mode="multi"),
+
+    ], style=styles.GLOBAL_STYLE)
+    ], fluid=True)
 
 
 dcu.callback_update_visible_columns(
     f'{module_name}_table',
     f'{module_name}_column_toggle',
-    dataframe)
+    get_dataframe)
 
 
 dcu.callback_update_table_style_and_visibility(f'{module_name}_table')
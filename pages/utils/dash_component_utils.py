@@ -1,15 +1,23 @@
 """TODO
 """
 
-from typing import Any, List, Dict, Tuple
+import os
+import csv
+import logging
+import tempfile
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Dict, Tuple
 from dash import html, callback
 from dash.dependencies import Input, Output
 import dash_bootstrap_components as dbc
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 import pages.utils.style_utils as styles
 
+logger = logging.getLogger(__name__)
+
 
 def app_description(
     title: str,
@@ -50,6 +58,172 @@ def app_description(
     return description
 
 
+def load_dataframe(
+    csv_path: str,
+    dtype: Dict[str, Any] = None,
+    links: Dict[str, str] = None
+) -> pd.DataFrame:
+    """Load a CSV database, caching the parsed table as a Parquet sidecar.
+
+    The first load parses the CSV, wraps the link columns in centered link
+    HTML and writes the result next to it as '<name>.parquet'. Later loads
+    read the typed Parquet file instead, skipping CSV tokenizing, dtype
+    inference and the link wrapping. The sidecar is regenerated when the
+    CSV is newer than it, or when it was written with other dtype or links
+    arguments, which are recorded in the file's metadata.
+
+    Args:
+        csv_path (str): Path to the CSV file to load.
+        dtype (Dict[str, Any]): Optional column types passed to
+            pd.read_csv, so the parser can skip dtype inference.
+        links (Dict[str, str]): Optional mapping of URL column names to
+            the link text shown for them. Missing columns are ignored.
+
+    Returns:
+        pd.DataFrame: The parsed table.
+    """
+    parquet_path, is_fresh = get_parquet_sidecar(csv_path)
+    # Stored in the sidecar's DataFrame.attrs, which Parquet round-trips
+    loader_options = repr((
+        sorted((dtype or {}).items()), sorted((links or {}).items())))
+    if is_fresh:
+        try:
+            dataframe = pd.read_parquet(parquet_path, engine='pyarrow')
+        except (OSError, ValueError):
+            # An unreadable sidecar is rebuilt from the CSV below
+            pass
+        else:
+            if dataframe.attrs.get('loader_options') == loader_options:
+                return dataframe
+
+    # Arrow's multi-threaded reader parses the CSV on every core
+    dataframe = pd.read_csv(csv_path, dtype=dtype, engine='pyarrow')
+    dataframe = wrap_link_columns(dataframe, links)
+    dataframe.attrs['loader_options'] = loader_options
+    write_parquet_sidecar(dataframe, parquet_path)
+    return dataframe
+
+
+def get_parquet_sidecar(csv_path: str) -> Tuple[str, bool]:
+    """Locate the Parquet sidecar of a CSV database.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+
+    Returns:
+        Tuple[str, bool]:
+            The sidecar's path, and whether it exists and is at least as
+            recent as the CSV.
+    """
+    parquet_path = f"{os.path.splitext(csv_path)[0]}.parquet"
+    is_fresh = (
+        os.path.exists(parquet_path) and
+        os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))
+    return parquet_path, is_fresh
+
+
+def read_table_shape(csv_path: str) -> Tuple[List[str], int]:
+    """Read a CSV database's column names and row count without loading it.
+
+    The shape comes from the Parquet sidecar's metadata when it is up to
+    date; otherwise the CSV is only split into rows, without building a
+    DataFrame. Page layouts and navigation item counts use this so that
+    rendering them does not load every database.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+
+    Returns:
+        Tuple[List[str], int]: The column names and the number of rows.
+    """
+    parquet_path, is_fresh = get_parquet_sidecar(csv_path)
+    if is_fresh:
+        try:
+            metadata = pq.read_metadata(parquet_path)
+        except (OSError, ValueError):
+            # Fall back to scanning the CSV
+            pass
+        else:
+            columns = [
+                name for name in metadata.schema.names
+                if not name.startswith('__index_level_')]
+            return columns, metadata.num_rows
+
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        columns = next(reader, [])
+        # Blank lines are skipped by pd.read_csv as well
+        return columns, sum(1 for row in reader if row)
+
+
+def write_parquet_sidecar(dataframe: pd.DataFrame, parquet_path: str) -> None:
+    """Write a Parquet sidecar so no reader sees it half written.
+
+    The table is written to a temporary file in the same directory and
+    moved into place with os.replace, which is atomic; another worker
+    loading the database at the same time reads either the previous file
+    or the complete new one. A failed write is logged and otherwise
+    ignored, and never leaves the temporary file behind.
+
+    Args:
+        dataframe (pd.DataFrame): The table to cache.
+        parquet_path (str): Path of the sidecar to create or replace.
+    """
+    directory, filename = os.path.split(parquet_path)
+    temp_path = None
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory or '.',
+            prefix=f"{os.path.splitext(filename)[0]}.",
+            suffix='.tmp.parquet')
+        os.close(fd)
+        dataframe.to_parquet(
+            temp_path, engine='pyarrow', compression='zstd')
+        os.replace(temp_path, parquet_path)
+        temp_path = None
+    except Exception:
+        # The cache is only an optimization; serve the CSV data regardless
+        logger.warning(
+            "Could not write Parquet sidecar '%s'", parquet_path,
+            exc_info=True)
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def wrap_link_columns(
+    dataframe: pd.DataFrame,
+    links: Dict[str, str] = None
+) -> pd.DataFrame:
+    """Wrap URL columns in centered link HTML, unless already wrapped.
+
+    A column counts as wrapped when its first non-empty value is link HTML,
+    so columns that already hold the HTML are returned without another
+    pass over them.
+
+    Args:
+        dataframe (pd.DataFrame): The table whose columns are wrapped.
+        links (Dict[str, str]): Mapping of URL column names to link text.
+            Columns missing from the table are ignored.
+
+    Returns:
+        pd.DataFrame: The table with its link columns wrapped.
+    """
+    for column, link_text in (links or {}).items():
+        if column not in dataframe.columns:
+            continue
+
+        urls = dataframe[column]
+        first_value = next(
+            (value for value in urls if isinstance(value, str) and value),
+            None)
+        if first_value is not None and first_value.startswith('<div'):
+            continue
+
+        dataframe[column] = generate_centered_links(urls, link_text)
+    return dataframe
+
+
 def callback_update_table_style_and_visibility(
     table_id: str
 ) -> None:
@@ -131,7 +305,7 @@ def callback_update_table_style_and_visibility(
 def callback_update_visible_columns(
     table_id: str,
     checklist_id: str,
-    dataframe: pd.DataFrame
+    get_dataframe: Callable[[], pd.DataFrame]
 ) -> None:
     """Create a callback function to update DataTable columns visibility.
 
@@ -144,6 +318,15 @@ def callback_update_visible_columns(
     - Update the table data to include only visible columns
     - Update the DataTable component with new column definitions and data
 
+    The DataFrame is converted to records once, on first use; each column
+    selection is served by projecting those cached records onto the
+    selected columns instead of re-running DataFrame.to_dict('records'),
+    and the result is memoized per selection.
+
+    The callback also fires when the page is rendered, so it supplies the
+    table's initial data; layouts leave the DataTable's data unset instead
+    of serializing the same records a second time.
+
     Args:
         table_id (str):
             The ID of the DataTable component to update.
@@ -152,15 +335,49 @@ def callback_update_visible_columns(
         checklist_id (str):
             The ID of the Checklist component that controls column visibility.
             This component should have column names as its options.
-        dataframe (pd.DataFrame):
-            The source DataFrame containing all possible columns and data.
-            Used to filter and format data based on selected columns.
+        get_dataframe (Callable[[], pd.DataFrame]):
+            Loader returning the source DataFrame containing all possible
+            columns and data. It is only called when the table is first
+            built, so the page's data is not loaded at import time.
 
     Returns:
         None:
             This function registers a callback with Dash and doesn't return
             a value directly.
     """
+    @lru_cache(maxsize=1)
+    def get_all_records() -> List[Dict[str, Any]]:
+        """Convert the DataFrame to records the first time it is needed."""
+        return get_dataframe().to_dict('records')
+
+    @lru_cache(maxsize=32)
+    def get_visible_table(
+        visible_columns: Tuple[str, ...]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Build column definitions and records for a column selection.
+
+        Args:
+            visible_columns:
+                Tuple of column names that should be displayed in the table.
+
+        Returns:
+            A tuple containing:
+                - List of column definitions for the visible columns
+                - List of dictionaries containing the filtered data records
+        """
+        dataframe = get_dataframe()
+        columns = create_column_definitions(
+            dataframe.columns, list(visible_columns))
+        # Keep the DataFrame's column order, whatever the checklist order
+        ordered_columns = [
+            column for column in dataframe.columns
+            if column in visible_columns]
+        filtered_data = [
+            {column: record[column] for column in ordered_columns}
+            for record in get_all_records()
+        ]
+        return columns, filtered_data
+
     @callback(
         Output(table_id, "columns"),
         Output(table_id, "data"),
@@ -178,13 +395,213 @@ def callback_update_visible_columns(
                 - List of column definitions for the visible columns
                 - List of dictionaries containing the filtered data records
         """
-        columns = create_column_definitions(dataframe, visible_columns)
-        filtered_data = dataframe[visible_columns].to_dict('records')
-        return columns, filtered_data
+        return get_visible_table(tuple(visible_columns))
 
 
-def create_column_definitions(
+FILTER_OPERATORS: List[List[str]] = [
+    ['ge ', '>='],
+    ['le ', '<='],
+    ['lt ', '<'],
+    ['gt ', '>'],
+    ['ne ', '!='],
+    ['eq ', '='],
+    ['contains '],
+    ['datestartswith ']
+]
+
+
+def split_filter_part(filter_part: str) -> Tuple[str, str, Any, str, bool]:
+    """Split one DataTable filter expression into its parts.
+
+    Parses expressions such as '{Pin Count} >= 4' or '{MPN} contains TB'
+    as produced by a DataTable with filter_action='custom'. Operators may
+    carry the table's case prefix, 'i' for case-insensitive or 's' for
+    case-sensitive matching (e.g. '{MPN} icontains tb', '{Color} i= blue').
+
+    Args:
+        filter_part (str): A single expression from the filter query.
+
+    Returns:
+        Tuple[str, str, Any, str, bool]:
+            The column name, the operator word (e.g. 'ge', 'contains'), the
+            value to compare against (a float when unquoted and numeric),
+            the value text as typed, without quotes, and whether the match
+            is case-sensitive, or (None, None, None, None, True) if the
+            expression could not be parsed.
+    """
+    filter_part = filter_part.strip()
+    name_end = filter_part.find('}')
+    if not filter_part.startswith('{') or name_end == -1:
+        return None, None, None, None, True
+    # Only the text right after the column name can be the operator, so
+    # operator-like text inside the name or the value is never split on
+    name = filter_part[1:name_end]
+    rest = filter_part[name_end + 1:].lstrip()
+
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            # An optional 'i' or 's' case prefix precedes the operator;
+            # without one the table's default is case-sensitive
+            if rest.startswith(operator):
+                case_prefix = ''
+            elif rest[:1] in ('i', 's') and rest[1:].startswith(operator):
+                case_prefix = rest[0]
+            else:
+                continue
+            value_part = rest[len(case_prefix) + len(operator):].strip()
+
+            if len(value_part) > 1 and value_part[0] == value_part[-1] and (
+                    value_part[0] in ("'", '"', '`')):
+                value_text = value_part[1: -1].replace(
+                    '\\' + value_part[0], value_part[0])
+                value = value_text
+            else:
+                value_text = value_part
+                try:
+                    value = float(value_part)
+                except ValueError:
+                    value = value_part
+
+            # Word operators are stored with a trailing space
+            return (name, operator_type[0].strip(), value, value_text,
+                    case_prefix != 'i')
+
+    return None, None, None, None, True
+
+
+def filter_dataframe(
         dataframe: pd.DataFrame,
+        filter_query: str
+) -> pd.DataFrame:
+    """Apply a DataTable filter query to a DataFrame.
+
+    Args:
+        dataframe: The DataFrame to filter.
+        filter_query:
+            The table's filter_query, with expressions joined by ' && '.
+
+    Returns:
+        The rows of the DataFrame matching every expression.
+    """
+    for filter_part in filter_query.split(' && '):
+        column, operator, value, value_text, case_sensitive = (
+            split_filter_part(filter_part))
+        if column not in dataframe.columns:
+            continue
+
+        series = dataframe[column]
+        is_numeric = pd.api.types.is_numeric_dtype(series)
+        if operator in ('contains', 'datestartswith') or not is_numeric:
+            # Text matches use the value exactly as typed, so '02' or
+            # '1234567' are not reformatted as numbers
+            value = value_text
+        if not case_sensitive and not is_numeric and isinstance(value, str):
+            series = series.str.lower()
+            value = value.lower()
+
+        if operator == 'contains':
+            mask = series.astype(str).str.contains(value, regex=False)
+        elif operator == 'datestartswith':
+            mask = series.astype(str).str.startswith(value)
+        else:
+            try:
+                mask = getattr(series, operator)(value)
+            except TypeError:
+                # Text typed into a numeric column matches nothing
+                mask = pd.Series(False, index=series.index)
+        dataframe = dataframe.loc[mask]
+
+    return dataframe
+
+
+def callback_update_table_page(
+    table_id: str,
+    checklist_id: str,
+    get_dataframe: Callable[[], pd.DataFrame]
+) -> None:
+    """Create a callback that serves a DataTable one page at a time.
+
+    This is a factory function for tables using page_action, sort_action
+    and filter_action set to 'custom'. Instead of sending every row to the
+    browser, the generated callback filters and sorts the DataFrame on the
+    server and returns only the rows of the requested page, restricted to
+    the columns selected in the checklist.
+
+    Args:
+        table_id (str):
+            The ID of the DataTable component to update.
+        checklist_id (str):
+            The ID of the Checklist component that controls column visibility.
+        get_dataframe (Callable[[], pd.DataFrame]):
+            Loader returning the source DataFrame containing all possible
+            columns and data, called on each request.
+
+    Returns:
+        None:
+            This function registers a callback with Dash and doesn't return
+            a value directly.
+    """
+    @callback(
+        Output(table_id, "columns"),
+        Output(table_id, "data"),
+        Output(table_id, "page_count"),
+        Output(table_id, "page_current"),
+        Input(checklist_id, "value"),
+        Input(table_id, "page_current"),
+        Input(table_id, "page_size"),
+        Input(table_id, "sort_by"),
+        Input(table_id, "filter_query"),
+    )
+    def update_table_page(
+        visible_columns, page_current, page_size, sort_by, filter_query
+    ):
+        """Return the visible columns and rows of the requested page.
+
+        Args:
+            visible_columns: Column names selected in the checklist.
+            page_current: Zero-based index of the requested page.
+            page_size: Number of rows per page.
+            sort_by: List of {'column_id', 'direction'} sort specifications.
+            filter_query: The table's filter expression.
+
+        Returns:
+            A tuple containing:
+                - List of column definitions for the visible columns
+                - List of dictionaries with the records of the page
+                - Total number of pages after filtering
+                - The page shown, clamped to the last page after filtering
+        """
+        page_current = page_current or 0
+        page_size = page_size or 10
+
+        dataframe = get_dataframe()
+        filtered = dataframe
+        if filter_query:
+            filtered = filter_dataframe(filtered, filter_query)
+        if sort_by:
+            filtered = filtered.sort_values(
+                [column['column_id'] for column in sort_by],
+                ascending=[
+                    column['direction'] == 'asc' for column in sort_by],
+                kind='stable')
+
+        page_count = max(1, -(-len(filtered) // page_size))
+        # A filter can leave fewer pages than the one being viewed
+        page_current = min(page_current, page_count - 1)
+        start = page_current * page_size
+        page = filtered.iloc[start:start + page_size]
+
+        columns = create_column_definitions(
+            dataframe.columns, visible_columns)
+        data = page[
+            [column for column in dataframe.columns
+             if column in visible_columns]
+        ].to_dict('records')
+        return columns, data, page_count, page_current
+
+
+def create_column_definitions(
+        columns: Iterable[str],
         visible_columns: List[str] = None
 ) -> List[Dict[str, Any]]:
     """Create column definitions for the Dash DataTable.
@@ -194,7 +611,8 @@ def create_column_definitions(
     datasheet links.
 
     Args:
-        dataframe: The pandas DataFrame containing the resistor data.
+        columns: The table's column names in display order. A DataFrame
+            can be passed as well, as iterating it yields its column names.
         visible_columns:
             Optional list of column names to include in the table.
             If None, all columns will be visible.
@@ -208,8 +626,9 @@ def create_column_definitions(
             - presentation:
                 The column's display type (markdown for datasheet links)
     """
+    columns = list(columns)
     if visible_columns is None:
-        visible_columns = dataframe.columns.tolist()
+        visible_columns = columns
 
     return [
         {
@@ -218,38 +637,35 @@ def create_column_definitions(
             "presentation":
                 "markdown" if column in ["Datasheet", "Trustedparts Search"]
                 else "input"
-        } for column in dataframe.columns if column in visible_columns
+        } for column in columns if column in visible_columns
     ]
 
 
-def generate_centered_link(
-        url_text: str,
+def generate_centered_links(
+        urls: pd.Series,
         link_text: str = "Link"
-) -> str:
-    """Generate a centered HTML link with consistent styling.
+) -> pd.Series:
+    """Generate centered HTML links for a whole column at once.
 
-    Creates an HTML div containing a centered link for the datasheet URLs.
-    Returns an empty string for null/NaN values to handle missing links
-    gracefully.
+    Creates an HTML div containing a centered link for each URL. The HTML
+    is built with pandas string concatenation over the column instead of
+    calling a Python function per row.
 
     Args:
-        url_text:
-            The URL to convert into a centered link. Can be any type,
-            as the function handles null/NaN values.
-        link_text:
-            The text to display for the link. Defaults to "Link".
+        urls: Column of URLs to convert into centered links. Null/NaN
+            entries are allowed.
+        link_text: The text to display for each link. Defaults to "Link".
 
     Returns:
-        A string containing HTML for a centered link, or an empty string if
-        the input is null/NaN.
+        A Series of HTML strings for centered links, with empty strings in
+        place of null/NaN inputs.
     """
-    if pd.notna(url_text):
-        return (
-            f'<div style="width:100%;text-align:center;">'
-            f'<a href="{url_text}" target="_blank" '
-            f'style="display:inline-block;">{link_text}</a></div>'
-        )
-    return ''
+    links = (
+        '<div style="width:100%;text-align:center;">'
+        '<a href="' + urls.astype(str) + '" target="_blank" '
+        f'style="display:inline-block;">{link_text}</a></div>'
+    )
+    return links.where(urls.notna(), '')
 
 
 def callback_update_page_size(
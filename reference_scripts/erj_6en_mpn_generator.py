@@ -15,10 +15,12 @@ Packaging Options:
 - V: Embossed Carrier Tape
 """
 
-import csv
-from typing import List, NamedTuple, Final, Iterator
+from functools import lru_cache
+from typing import List, NamedTuple, Final, Iterable, Iterator
 from enum import Enum
+import numpy as np
 import kicad_resistor_symbol_generator as ki_rsg
+import file_handler_utilities as utils
 
 
 class SeriesType(Enum):
@@ -56,7 +58,7 @@ VOLTAGE_RATING: Final[str] = "150V"
 CASE_CODE_IN: Final[str] = "0805"
 CASE_CODE_MM: Final[str] = "2012"
 
-E96_BASE_VALUES: Final[List[float]] = [
+E96_BASE_VALUES: Final[np.ndarray] = np.array([
     10.0, 10.2, 10.5, 10.7, 11.0, 11.3, 11.5, 11.8, 12.1, 12.4, 12.7, 13.0,
     13.3, 13.7, 14.0, 14.3, 14.7, 15.0, 15.4, 15.8, 16.2, 16.5, 16.9, 17.4,
     17.8, 18.2, 18.7, 19.1, 19.6, 20.0, 20.5, 21.0, 21.5, 22.1, 22.6, 23.2,
@@ -65,12 +67,12 @@ E96_BASE_VALUES: Final[List[float]] = [
     42.2, 43.2, 44.2, 45.3, 46.4, 47.5, 48.7, 49.9, 51.1, 52.3, 53.6, 54.9,
     56.2, 57.6, 59.0, 60.4, 61.9, 63.4, 64.9, 66.5, 68.1, 69.8, 71.5, 73.2,
     75.0, 76.8, 78.7, 80.6, 82.5, 84.5, 86.6, 88.7, 90.9, 93.1, 95.3, 97.6
-]
+], dtype=np.float64)
 
-E24_BASE_VALUES: Final[List[float]] = [
+E24_BASE_VALUES: Final[np.ndarray] = np.array([
     10.0, 11.0, 12.0, 13.0, 15.0, 16.0, 18.0, 20.0, 22.0, 24.0, 27.0, 30.0,
     33.0, 36.0, 39.0, 43.0, 47.0, 51.0, 56.0, 62.0, 68.0, 75.0, 82.0, 91.0
-]
+], dtype=np.float64)
 
 TOLERANCE_MAP: Final[dict[SeriesType, dict[str, str]]] = {
     SeriesType.E96: {'F': '1%'},
@@ -79,7 +81,19 @@ TOLERANCE_MAP: Final[dict[SeriesType, dict[str, str]]] = {
 
 PACKAGING_OPTIONS: Final[List[str]] = ['V']
 
+CSV_HEADERS: Final[List[str]] = [
+    'Symbol Name', 'Reference', 'Value', 'Footprint', 'Datasheet',
+    'Description', 'Manufacturer', 'MPN', 'Tolerance', 'Voltage Rating',
+    'Case Code - in', 'Case Code - mm', 'Series'
+]
+
+# Trailing CSV columns, identical for every part in the series
+CSV_ROW_TAIL: Final[tuple[str, ...]] = (
+    VOLTAGE_RATING, CASE_CODE_IN, CASE_CODE_MM, BASE_SERIES
+)
+
 
+@lru_cache(maxsize=None)
 def format_resistance_value(value: float) -> str:
     """Convert resistance value to a human-readable format."""
     def clean_number(num: float) -> str:
@@ -92,9 +106,10 @@ def format_resistance_value(value: float) -> str:
     return f"{clean_number(value)} Ω"
 
 
-def generate_resistance_code(value: float) -> str:
+def generate_resistance_codes(values: np.ndarray) -> List[str]:
     """
-    Generate the resistance code portion of the Panasonic part number.
+    Generate the resistance code portion of the Panasonic part number for
+    a whole array of values at once.
     Format: 4 characters total
 
     For values < 100Ω:
@@ -108,54 +123,73 @@ def generate_resistance_code(value: float) -> str:
             2 = ×100 (10k-99.9kΩ)
             3 = ×1000 (100k-999kΩ)
             4 = ×10000 (1MΩ)
+
+    The R-notation digits, significant digits and multiplier are computed
+    as integer arrays in a single pass, leaving only the final 4-character
+    formatting to Python.
     """
-    if value < 10 or value > 2_200_000:
+    values = np.asarray(values, dtype=np.float64)
+    if np.any((values < 10) | (values > 2_200_000)):
         raise ValueError("Resistance value out of range (10Ω to 2.2MΩ)")
 
-    # Handle values less than 100Ω using R notation
-    if value < 100:
-        whole = int(value)
-        decimal = int(round((value - whole) * 10))
-        return f"{whole:02d}R{decimal}"
-
-    # For values ≥ 100Ω, determine multiplier and significant digits
-    if value < 1000:  # 100-999Ω
-        significant = int(round(value))
-        multiplier = "0"
-    elif value < 10000:  # 1k-9.99kΩ
-        significant = int(round(value / 10))
-        multiplier = "1"
-    elif value < 100000:  # 10k-99.9kΩ
-        significant = int(round(value / 100))
-        multiplier = "2"
-    elif value < 1000000:  # 100k-999kΩ
-        significant = int(round(value / 1000))
-        multiplier = "3"
-    else:  # 1MΩ-2.2MΩ
-        significant = int(round(value / 10000))
-        multiplier = "4"
-
-    return f"{significant:03d}{multiplier}"
-
-
-def generate_resistance_values(base_values: List[float]) -> Iterator[float]:
+    # R notation parts for values < 100Ω
+    whole = values.astype(np.int64)
+    decimal = np.rint((values - whole) * 10).astype(np.int64)
+
+    # Multiplier digit is the decade minus two, capped at 4 for 1MΩ and up
+    multiplier = np.searchsorted(
+        np.array([1000.0, 10000.0, 100000.0, 1000000.0]), values,
+        side='right')
+    significant = np.rint(
+        values / np.power(10.0, multiplier)).astype(np.int64)
+
+    return [
+        f"{whole_part:02d}R{decimal_part}" if is_r_notation
+        else f"{significant_part:03d}{multiplier_part}"
+        for is_r_notation, whole_part, decimal_part,
+        significant_part, multiplier_part in zip(
+            (values < 100).tolist(), whole.tolist(), decimal.tolist(),
+            significant.tolist(), multiplier.tolist())
+    ]
+
+
+def generate_resistance_values(base_values: np.ndarray) -> np.ndarray:
     """Generate all valid resistance values from base values."""
-    for base_value in base_values:
-        current_value = base_value
-        while current_value <= 2_200_000:
-            if current_value >= 10:
-                yield current_value
-            current_value *= 10
+    decades = np.power(10.0, np.arange(0, 6))
+    grid = np.outer(base_values, decades).ravel()
+    return grid[(grid >= 10) & (grid <= 2_200_000)]
+
+
+def build_code_table(
+    base_value_sets: Iterable[np.ndarray]
+) -> dict[float, str]:
+    """
+    Precompute the resistance code of every value the series can produce.
+
+    The E96/E24 base sets are fixed, so the whole value space is known at
+    import time; keys are the exact floats generate_resistance_values
+    yields, so generation can look codes up instead of computing them.
+    """
+    code_table: dict[float, str] = {}
+    for base_values in base_value_sets:
+        values = generate_resistance_values(base_values)
+        code_table.update(
+            zip(values.tolist(), generate_resistance_codes(values)))
+    return code_table
+
+
+CODE_TABLE: Final[dict[float, str]] = build_code_table(
+    (E96_BASE_VALUES, E24_BASE_VALUES))
 
 
 def create_part_info(
     value: float,
+    resistance_code: str,
     tolerance_code: str,
     tolerance_value: str,
     packaging: str
 ) -> PartInfo:
     """Create a PartInfo instance for given parameters."""
-    resistance_code = generate_resistance_code(value)
     mpn = f"{BASE_SERIES}{tolerance_code}{resistance_code}{packaging}"
     symbol_name = f"R_{mpn}"
     description = (
@@ -163,106 +197,115 @@ def create_part_info(
         f"{tolerance_value} 0805 {VOLTAGE_RATING}"
     )
 
-    return PartInfo(
-        symbol_name=symbol_name,
-        reference="R",
-        value=value,
-        footprint=FOOTPRINT,
-        datasheet=DATASHEET,
-        description=description,
-        manufacturer=MANUFACTURER,
-        mpn=mpn,
-        tolerance=tolerance_value,
-        voltage_rating=VOLTAGE_RATING,
-        case_code_in=CASE_CODE_IN,
-        case_code_mm=CASE_CODE_MM,
-        series=BASE_SERIES
-    )
-
-
-def generate_part_numbers() -> List[PartInfo]:
+    # Build from a plain tuple in field order, skipping keyword dispatch
+    return PartInfo._make((
+        symbol_name,
+        "R",
+        value,
+        FOOTPRINT,
+        DATASHEET,
+        description,
+        MANUFACTURER,
+        mpn,
+        tolerance_value,
+        VOLTAGE_RATING,
+        CASE_CODE_IN,
+        CASE_CODE_MM,
+        BASE_SERIES
+    ))
+
+
+def generate_part_numbers() -> Iterator[PartInfo]:
     """Generate all possible part numbers for both E96 and E24 series."""
-    part_numbers: List[PartInfo] = []
+    # For values over 1MΩ, only generate F (1%) tolerance parts
+    high_suffixes = [
+        ('F', '1%', packaging) for packaging in PACKAGING_OPTIONS
+    ]
+    # Bound once so the inner loop skips the global lookups
+    make_part = create_part_info
+    code_table = CODE_TABLE
 
     for series_type in SeriesType:
         base_values = (
             E96_BASE_VALUES if series_type == SeriesType.E96
             else E24_BASE_VALUES
         )
-
-        for value in generate_resistance_values(base_values):
-            if value <= 2_200_000:  # Ensure we don't exceed maximum resistance
-                # For values over 1MΩ, only generate F (1%) tolerance parts
-                if value > 1_000_000:
-                    tolerance_codes = {'F': '1%'}
-                else:
-                    tolerance_codes = TOLERANCE_MAP[series_type]
-
-                for tolerance_code, tolerance_value in tolerance_codes.items():
-                    for packaging in PACKAGING_OPTIONS:
-                        part_numbers.append(create_part_info(
-                            value,
-                            tolerance_code,
-                            tolerance_value,
-                            packaging
-                        ))
-
-    return part_numbers
+        normal_suffixes = [
+            (tolerance_code, tolerance_value, packaging)
+            for tolerance_code, tolerance_value in
+            TOLERANCE_MAP[series_type].items()
+            for packaging in PACKAGING_OPTIONS
+        ]
+
+        for value in generate_resistance_values(base_values).tolist():
+            resistance_code = code_table[value]
+            suffixes = (
+                high_suffixes if value > 1_000_000 else normal_suffixes
+            )
+            for tolerance_code, tolerance_value, packaging in suffixes:
+                yield make_part(
+                    value,
+                    resistance_code,
+                    tolerance_code,
+                    tolerance_value,
+                    packaging
+                )
+
+
+def format_csv_row(part_info: PartInfo) -> tuple[str, ...]:
+    """Format a PartInfo as a CSV row matching CSV_HEADERS."""
+    # Only the per-part fields are read; the series constants are shared
+    return (
+        part_info.symbol_name,
+        "R",
+        format_resistance_value(part_info.value),
+        FOOTPRINT,
+        DATASHEET,
+        part_info.description,
+        MANUFACTURER,
+        part_info.mpn,
+        part_info.tolerance
+    ) + CSV_ROW_TAIL
 
 
 def write_to_csv(
-    part_numbers: List[PartInfo],
+    part_numbers: Iterable[PartInfo],
     filename: str = 'ERJ6EN_part_numbers.csv',
     encoding: str = 'utf-8'
 ) -> None:
-    """Write the generated part numbers to a CSV file."""
-    headers: Final[List[str]] = [
-        'Symbol Name', 'Reference', 'Value', 'Footprint', 'Datasheet',
-        'Description', 'Manufacturer', 'MPN', 'Tolerance', 'Voltage Rating',
-        'Case Code - in', 'Case Code - mm', 'Series'
-    ]
+    """
+    Stream the generated part numbers to a CSV file.
 
-    with open(filename, 'w', newline='', encoding=encoding) as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(headers)
-
-        for part_info in part_numbers:
-            writer.writerow([
-                part_info.symbol_name,
-                part_info.reference,
-                format_resistance_value(part_info.value),
-                part_info.footprint,
-                part_info.datasheet,
-                part_info.description,
-                part_info.manufacturer,
-                part_info.mpn,
-                part_info.tolerance,
-                part_info.voltage_rating,
-                part_info.case_code_in,
-                part_info.case_code_mm,
-                part_info.series
-            ])
+    Parts are consumed one at a time, so a generator can be passed in
+    without materializing the whole list.
+    """
+    rows = (format_csv_row(part_info) for part_info in part_numbers)
+
+    with open(
+        filename, 'w', newline='', encoding=encoding, buffering=1024 * 1024
+    ) as csvfile:
+        utils.write_csv_rows(csvfile, [CSV_HEADERS])
+        utils.write_csv_rows(csvfile, rows)
 
 
 if __name__ == "__main__":
-    generated_part_numbers: List[PartInfo] = generate_part_numbers()
+    generated_part_numbers: List[PartInfo] = list(generate_part_numbers())
     write_to_csv(generated_part_numbers)
     print(
         f"Generated {len(generated_part_numbers)} part numbers "
         "in 'ERJ6EN_part_numbers.csv'"
     )
-    file_pairs = [
-        ('ERJ6EN_part_numbers.csv', 'RESISTORS_ERJ6EN_DATA_BASE.kicad_sym')
+
+    # Hand the rows to the symbol generator directly instead of
+    # re-reading the CSV that was just written
+    OUTPUT_SYMBOL = 'RESISTORS_ERJ6EN_DATA_BASE.kicad_sym'
+    records = [
+        dict(zip(CSV_HEADERS, format_csv_row(part_info)))
+        for part_info in generated_part_numbers
     ]
 
-    for input_csv, output_symbol in file_pairs:
-        try:
-            ki_rsg.generate_kicad_symbol(input_csv, output_symbol)
-            print(
-                f"KiCad symbol file '{output_symbol}' generated successfully.")
-        except FileNotFoundError:
-            print(f"Error: Input CSV file '{input_csv}' not found.")
-        except csv.Error as e:
-            print(f"Error reading CSV file '{input_csv}': {e}")
-        except IOError as e:
-            print(f"Error writing to output file '{output_symbol}': {e}")
+    try:
+        ki_rsg.generate_kicad_symbol_from_records(records, OUTPUT_SYMBOL)
+        print(f"KiCad symbol file '{OUTPUT_SYMBOL}' generated successfully.")
+    except IOError as e:
+        print(f"Error writing to output file '{OUTPUT_SYMBOL}': {e}")
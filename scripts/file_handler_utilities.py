@@ -1,10 +1,39 @@
 """TODO"""
 import csv
-from typing import List, Final, NamedTuple
+from typing import Iterable, List, Dict, Final, NamedTuple, Sequence, TextIO
+
+# Large write buffer so a whole CSV file is flushed in one or two syscalls
+CSV_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+# Line terminator of csv.writer's default (excel) dialect
+CSV_LINE_TERMINATOR: Final[str] = '\r\n'
+
+
+def write_csv_rows(csvfile: TextIO, rows: Iterable[Sequence[str]]) -> None:
+    """
+    Write rows exactly as csv.writer would, skipping it for plain rows.
+
+    Generated part data almost never needs quoting, so each row is joined
+    directly and only rows containing a delimiter, quote or line break
+    are handed to csv.writer to be quoted.
+
+    Args:
+        csvfile: File opened for writing with newline=''
+        rows: Rows of string fields
+    """
+    writer = csv.writer(csvfile)
+    write = csvfile.write
+    for row in rows:
+        line = ','.join(row)
+        if (line and line.count(',') == len(row) - 1 and '"' not in line
+                and '\n' not in line and '\r' not in line):
+            write(line + CSV_LINE_TERMINATOR)
+        else:
+            writer.writerow(row)
 
 
 def write_to_csv(
-    parts_list: List[NamedTuple],
+    parts_list: Iterable[NamedTuple],
     output_file: str,
     header_mapping: List[str],
     encoding: str = 'utf-8'
@@ -13,21 +42,51 @@ def write_to_csv(
     Write specifications to CSV file using global header mapping.
 
     Args:
-        parts_list: List of parts to write
+        parts_list: Parts to write, consumed lazily so generators can be
+            streamed straight to the file
         output_file: Output filename
         encoding: Character encoding
     """
 
-    # Prepare all rows before opening file
     headers: Final[List[str]] = list(header_mapping.keys())
-    rows = [headers]
-    rows.extend([
-        [header_mapping[header](part) for header in headers]
+    getters = list(header_mapping.values())
+    rows = (
+        ['' if value is None else str(value)
+         for value in (getter(part) for getter in getters)]
         for part in parts_list
-    ])
+    )
 
-    # Write all rows at once
-    with open(f'data/{output_file}', 'w', newline='', encoding=encoding) as \
-            csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerows(rows)
+    with open(
+        f'data/{output_file}', 'w', newline='', encoding=encoding,
+        buffering=CSV_BUFFER_SIZE
+    ) as csvfile:
+        write_csv_rows(csvfile, [headers])
+        write_csv_rows(csvfile, rows)
+
+
+def parts_to_records(
+    parts_list: Iterable[NamedTuple],
+    header_mapping: List[str]
+) -> List[Dict[str, str]]:
+    """
+    Convert parts to row dictionaries as they would be read back from CSV.
+
+    Values are stringified the same way csv.writer does, so the records
+    can be handed straight to a KiCad symbol generator instead of writing
+    and re-reading the CSV file.
+
+    Args:
+        parts_list: Parts to convert
+        header_mapping: Mapping of CSV headers to part attribute getters
+
+    Returns:
+        List of dictionaries keyed by CSV header, one per part
+    """
+    records = []
+    for part in parts_list:
+        record = {}
+        for header, getter in header_mapping.items():
+            value = getter(part)
+            record[header] = '' if value is None else str(value)
+        records.append(record)
+    return records
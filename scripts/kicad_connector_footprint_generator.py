@@ -4,8 +4,9 @@ KiCad Footprint Generator Module
 Generates .kicad_mod files for connector series based on specifications.
 """
 
-from typing import Dict, NamedTuple, Callable, Tuple
-from uuid import uuid4
+import os
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Callable, Tuple
 import series_specs_connectors as ssc
 
 
@@ -28,6 +29,21 @@ class ConnectorSpecs(NamedTuple):
     model_offset_func: Callable  # Function to calculate model offset
 
 
+def generate_uuids() -> Iterator[str]:
+    """
+    Yield sequential UUIDs for the items of one footprint.
+
+    Library footprints only need UUIDs that are unique within the file;
+    KiCad assigns fresh ones to every footprint instance placed on a
+    board. Numbering the items from 1 skips random number generation and
+    keeps regenerated footprint files identical between runs.
+
+    Returns:
+        Iterator of UUIDs in canonical 8-4-4-4-12 hex form, in item order
+    """
+    return map('00000000-0000-4000-8000-{:012x}'.format, count(1))
+
+
 def offset_add(
         base: Tuple[float, float, float],
         step: float
@@ -221,11 +237,12 @@ def generate_footprint(part: ssc.PartInfo, specs: ConnectorSpecs) -> str:
         String containing the complete .kicad_mod file content in KiCad format
     """
     dimensions = calculate_dimensions(part, specs)
+    uuids = generate_uuids()
     sections = [
         generate_header(part.mpn),
-        generate_properties(part, specs, dimensions),
-        generate_shapes(dimensions, specs),
-        generate_pads(part, specs, dimensions),
+        generate_properties(part, specs, dimensions, uuids),
+        generate_shapes(dimensions, specs, uuids),
+        generate_pads(part, specs, dimensions, uuids),
         generate_3d_model(part, specs),
         ")"  # Close the footprint
     ]
@@ -264,7 +281,8 @@ def generate_header(mpn: str) -> str:
 def generate_properties(
     part: ssc.PartInfo,
     specs: ConnectorSpecs,
-    dimensions: dict
+    dimensions: dict,
+    uuids: Iterator[str]
 ) -> str:
     """Generate the properties section of the footprint."""
     font_effects = (
@@ -289,46 +307,55 @@ def generate_properties(
         f'    (property "Reference" "REF**"\n'
         f'        (at 0 {specs.ref_y} 0)\n'
         f'        (layer "F.SilkS")\n'
-        f'        (uuid "{uuid4()}")\n'
+        f'        (uuid "{next(uuids)}")\n'
         f'{font_effects}\n'
         f'    )\n'
         f'    (property "Value" "{part.mpn}"\n'
         f'        (at 0 {specs.mpn_y} 0)\n'
         f'        (layer "F.Fab")\n'
-        f'        (uuid "{uuid4()}")\n'
+        f'        (uuid "{next(uuids)}")\n'
         f'{font_effects}\n'
         f'    )\n'
         f'    (property "Footprint" ""\n'
         f'        (at {dimensions["start_pos"]} 0 0)\n'
         f'        (layer "F.Fab")\n'
         f'        (hide yes)\n'
-        f'        (uuid "{uuid4()}")\n'
+        f'        (uuid "{next(uuids)}")\n'
         f'{hidden_font_effects}\n'
         f'    )\n'
         f'    (property "Datasheet" ""\n'
         f'        (at {dimensions["start_pos"]} 0 0)\n'
         f'        (layer "F.Fab")\n'
         f'        (hide yes)\n'
-        f'        (uuid "{uuid4()}")\n'
+        f'        (uuid "{next(uuids)}")\n'
         f'{hidden_font_effects}\n'
         f'    )\n'
         f'    (property "Description" ""\n'
         f'        (at {dimensions["start_pos"]} 0 0)\n'
         f'        (layer "F.Fab")\n'
         f'        (hide yes)\n'
-        f'        (uuid "{uuid4()}")\n'
+        f'        (uuid "{next(uuids)}")\n'
         f'{hidden_font_effects}\n'
         f'    )'
     )
 
 
-def generate_shapes(dimensions: dict, specs: ConnectorSpecs) -> str:
+def generate_shapes(
+    dimensions: dict,
+    specs: ConnectorSpecs,
+    uuids: Iterator[str]
+) -> str:
     """Generate the shapes section of the footprint."""
+    # Read the specs once; the nested builders below run several times
+    silk_margin = specs.silk_margin
+    height_bottom = specs.height_bottom
+    height_top = specs.height_top
+
     circle_center = -(
-        dimensions["total_half_width_left"] + specs.silk_margin * 6
+        dimensions["total_half_width_left"] + silk_margin * 6
     )
     circle_end = -(
-        dimensions["total_half_width_left"] + specs.silk_margin * 2
+        dimensions["total_half_width_left"] + silk_margin * 2
     )
 
     rect_start = -dimensions["total_half_width_left"]
@@ -337,15 +364,15 @@ def generate_shapes(dimensions: dict, specs: ConnectorSpecs) -> str:
     def generate_rect(layer: str, stroke_width: str) -> str:
         return (
             f'    (fp_rect\n'
-            f'        (start {rect_start:.3f} {specs.height_bottom})\n'
-            f'        (end {rect_end:.3f} {specs.height_top})\n'
+            f'        (start {rect_start:.3f} {height_bottom})\n'
+            f'        (end {rect_end:.3f} {height_top})\n'
             f'        (stroke\n'
             f'            (width {stroke_width})\n'
             f'            (type default)\n'
             f'        )\n'
             f'        (fill none)\n'
             f'        (layer "{layer}")\n'
-            f'        (uuid "{uuid4()}")\n'
+            f'        (uuid "{next(uuids)}")\n'
             f'    )'
         )
 
@@ -355,21 +382,21 @@ def generate_shapes(dimensions: dict, specs: ConnectorSpecs) -> str:
             f'        (center {circle_center:.3f} 0)\n'
             f'        (end {circle_end:.3f} 0)\n'
             f'        (stroke\n'
-            f'            (width {specs.silk_margin})\n'
+            f'            (width {silk_margin})\n'
             f'            (type solid)\n'
             f'        )\n'
             f'        (fill {fill})\n'
             f'        (layer "{layer}")\n'
-            f'        (uuid "{uuid4()}")\n'
+            f'        (uuid "{next(uuids)}")\n'
             f'    )'
         )
 
     shapes = [
         '    (attr through_hole)',
-        generate_rect("F.SilkS", specs.silk_margin),
+        generate_rect("F.SilkS", silk_margin),
         generate_circle("F.SilkS", "solid"),
         generate_rect("F.CrtYd", "0.00635"),
-        generate_rect("F.Fab", specs.silk_margin),
+        generate_rect("F.Fab", silk_margin),
         generate_circle("F.Fab", "none")
     ]
 
@@ -379,30 +406,39 @@ def generate_shapes(dimensions: dict, specs: ConnectorSpecs) -> str:
 def generate_pads(
     part: ssc.PartInfo,
     specs: ConnectorSpecs,
-    dimensions: dict
+    dimensions: dict,
+    uuids: Iterator[str]
 ) -> str:
     """Generate the pads section of the footprint."""
+    # Pad geometry is the same for every pin, so format it once
+    pad_body = (
+        f'        (size {specs.pad_size} {specs.pad_size})\n'
+        f'        (drill {specs.drill_size})\n'
+        f'        (layers "*.Cu" "*.Mask")\n'
+        f'        (remove_unused_layers no)\n'
+        f'        (solder_mask_margin {specs.mask_margin})\n'
+    )
+    start_pos = dimensions["start_pos"]
+    pitch = part.pitch
+
     pads = []
+    append_pad = pads.append
     for pin in range(part.pin_count):
-        x_pos = dimensions["start_pos"] + (pin * part.pitch)
+        x_pos = start_pos + (pin * pitch)
         pad_type = "rect" if pin == 0 else "circle"
-        pad = (
+        append_pad(
             f'    (pad "{pin + 1}" thru_hole {pad_type}\n'
             f'        (at {x_pos:.3f} 0)\n'
-            f'        (size {specs.pad_size} {specs.pad_size})\n'
-            f'        (drill {specs.drill_size})\n'
-            f'        (layers "*.Cu" "*.Mask")\n'
-            f'        (remove_unused_layers no)\n'
-            f'        (solder_mask_margin {specs.mask_margin})\n'
-            f'        (uuid "{uuid4()}")\n'
+            f'{pad_body}'
+            f'        (uuid "{next(uuids)}")\n'
             f'    )'
         )
-        pads.append(pad)
     return "\n".join(pads)
 
 
 def generate_3d_model(part: ssc.PartInfo, specs: ConnectorSpecs) -> str:
     """Generate the 3D model section of the footprint."""
+    rotation_x, rotation_y, rotation_z = specs.model_rotation
     step_offset = (part.pin_count - 2) * specs.step_multiplier
     model_offset = specs.model_offset_func(
         specs.model_offset_base, step_offset)
@@ -422,8 +458,7 @@ def generate_3d_model(part: ssc.PartInfo, specs: ConnectorSpecs) -> str:
         f'            (xyz 1 1 1)\n'
         f'        )\n'
         f'        (rotate\n'
-        f'            (xyz {specs.model_rotation[0]} '
-        f'{specs.model_rotation[1]} {specs.model_rotation[2]})\n'
+        f'            (xyz {rotation_x} {rotation_y} {rotation_z})\n'
         f'        )\n'
         f'    )'
     )
@@ -455,5 +490,54 @@ def generate_footprint_file(part: ssc.PartInfo) -> None:
 
     # Save to file
     filename = f"connector_footprints.pretty/{part.mpn}.kicad_mod"
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(footprint_content)
+    write_file(filename, footprint_content.encode('utf-8'))
+
+
+def generate_footprint_files(
+    parts: Iterable[ssc.PartInfo]
+) -> List[Tuple[str, Exception]]:
+    """
+    Generate and save .kicad_mod files for a batch of connector parts.
+
+    A part that fails does not stop the batch; its error is collected and
+    the remaining parts are still generated.
+
+    Args:
+        parts: Component specifications of the parts to generate
+
+    Returns:
+        The MPN and error of every part whose footprint could not be
+        generated, either because its connector series is not found in
+        CONNECTOR_SPECS or because its file could not be written
+    """
+    failures = []
+    for part in parts:
+        try:
+            generate_footprint_file(part)
+        except (ValueError, IOError) as error:
+            failures.append((part.mpn, error))
+    return failures
+
+
+def write_file(filename: str, data: bytes) -> None:
+    """
+    Write bytes to a file with raw OS calls.
+
+    Each footprint is encoded up front and written with a single
+    os.write, skipping the text and buffering layers of open().
+
+    Args:
+        filename: Path of the file to create or truncate
+        data: Complete file content
+
+    Raises:
+        IOError: If the file cannot be opened or written
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write less than requested
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -42,6 +42,31 @@ def generate_kicad_symbol(
         IOError: If there's an error writing to the output file.
     """
     component_data_list = read_csv_data(input_csv_file, encoding)
+    generate_kicad_symbol_from_records(
+        component_data_list, output_symbol_file, encoding)
+
+
+def generate_kicad_symbol_from_records(
+        component_data_list: List[Dict[str, str]],
+        output_symbol_file: str,
+        encoding: str = 'utf-8'
+) -> None:
+    """
+    Generate a KiCad symbol file from in-memory component records.
+
+    Takes the same row dictionaries that read_csv_data returns, so callers
+    that already hold the component data can skip re-reading the CSV.
+
+    Args:
+        component_data_list (List[Dict[str, str]]):
+            Component data, one dictionary per component keyed by header.
+        output_symbol_file (str): Path for the output .kicad_sym file.
+        encoding (str, optional):
+            Character encoding to use. Defaults to 'utf-8'.
+
+    Raises:
+        IOError: If there's an error writing to the output file.
+    """
     all_properties = get_all_properties(component_data_list)
     property_order = get_property_order(all_properties)
 
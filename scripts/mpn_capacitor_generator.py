@@ -16,7 +16,9 @@ Features:
 
 import csv
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Final, Iterator, Dict, Set
+import numpy as np
 from colorama import init, Fore, Style
 import kicad_capacitor_symbol_generator as ki_csg
 import series_specs_capacitors as ssc
@@ -46,17 +48,21 @@ class PartParameters:
 
     Attributes:
         capacitance: Capacitance value in Farads
+        capacitance_code: Part number code for the capacitance value
         tolerance_code: Code indicating component tolerance
         tolerance_value: Human-readable tolerance specification
         packaging: Component packaging code
-        series_type: Dielectric type specification
+        dielectric: Dielectric type name (e.g. "X7R")
+        dielectric_code: Part number code for the dielectric type
         specs: Complete series specifications
     """
     capacitance: float
+    capacitance_code: str
     tolerance_code: str
     tolerance_value: str
     packaging: str
-    series_type: ssc.SeriesType
+    dielectric: str
+    dielectric_code: str
     specs: ssc.SeriesSpec
 
 
@@ -99,7 +105,12 @@ CHARACTERISTIC_CONFIGS: Final[Dict[str, List[CharacteristicThreshold]]] = {
     ]
 }
 
+E12_MULTIPLIERS: Final[np.ndarray] = np.array([
+    1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2
+], dtype=np.float64)
 
+
+@lru_cache(maxsize=None)
 def format_capacitance_value(capacitance: float) -> str:
     """Convert capacitance value to human-readable format with units.
 
@@ -130,45 +141,52 @@ def format_capacitance_value(capacitance: float) -> str:
     return f"{formatted} {unit}"
 
 
-def generate_capacitance_code(capacitance: float) -> str:
-    """Generate the capacitance portion of Murata part number.
+def generate_capacitance_codes(capacitances: np.ndarray) -> List[str]:
+    """Generate the capacitance portion of Murata part numbers in one pass.
+
+    Values under 10pF use R notation, values under 1000pF three significant
+    digits, and larger values two significant digits plus a zero count.
+    The digits for every notation are computed as integer arrays up front
+    and only the final string formatting is done per value.
 
     Args:
-        capacitance: Capacitance value in Farads
+        capacitances: Array of capacitance values in Farads
 
     Returns:
-        str: Three-character code representing the capacitance value
+        List[str]: Three-character capacitance codes, one per input value
     """
-    # Convert to picofarads
-    pf_value = capacitance * 1e12
-
-    # Handle values under 10pF
-    if pf_value < 10:
-        whole = int(pf_value)
-        decimal = int((pf_value - whole) * 10)
-        return f"{whole}R{decimal}"
-
-    # Handle values under 1000pF
-    if pf_value < 1000:
-        significant = round(pf_value)
-        if significant % 10 == 0:
-            significant += 1
-        return f"{significant:03d}"
-
-    # Handle values 1000pF and above
-    # Convert to scientific notation with 2 significant digits
-    sci_notation = f"{pf_value:.2e}"
-
-    # Split into significand and power
-    parts = sci_notation.split('e')
-    significand = float(parts[0])
-    power = int(parts[1])
-
-    # Calculate first two digits and zero count
-    first_two = int(round(significand * 10))
+    pf_values = np.asarray(capacitances, dtype=np.float64) * 1e12
+
+    # R notation digits for values under 10pF
+    whole = pf_values.astype(np.int64)
+    decimal = ((pf_values - whole) * 10).astype(np.int64)
+
+    # Three significant digits for values under 1000pF
+    significant = np.rint(pf_values).astype(np.int64)
+    significant += significant % 10 == 0
+
+    # Two significant digits plus zero count for 1000pF and above
+    power = np.floor(np.log10(pf_values)).astype(np.int64)
+    significand = np.round(pf_values / np.power(10.0, power), 2)
+    rollover = significand >= 10
+    power += rollover
+    significand = np.where(rollover, significand / 10, significand)
+    first_two = np.rint(significand * 10).astype(np.int64)
     zero_count = power - 1
 
-    return f"{first_two}{zero_count}"
+    codes = []
+    for pf_value, whole_part, decimal_part, significant_part, \
+            first_two_part, zero_count_part in zip(
+                pf_values.tolist(), whole.tolist(), decimal.tolist(),
+                significant.tolist(), first_two.tolist(),
+                zero_count.tolist()):
+        if pf_value < 10:
+            codes.append(f"{whole_part}R{decimal_part}")
+        elif pf_value < 1000:
+            codes.append(f"{significant_part:03d}")
+        else:
+            codes.append(f"{first_two_part}{zero_count_part}")
+    return codes
 
 
 def get_characteristic_code(capacitance: float, specs: ssc.SeriesSpec) -> str:
@@ -184,10 +202,33 @@ def get_characteristic_code(capacitance: float, specs: ssc.SeriesSpec) -> str:
     Raises:
         ValueError: If specs.base_series is not a supported series
     """
-    if specs.base_series not in CHARACTERISTIC_CONFIGS:
-        raise ValueError(f"Unknown series: {specs.base_series}")
+    return get_series_characteristic_code(specs.base_series, capacitance)
+
+
+@lru_cache(maxsize=None)
+def get_series_characteristic_code(
+    base_series: str,
+    capacitance: float
+) -> str:
+    """Determine characteristic code for a base series and capacitance.
+
+    Keyed on the base series name rather than the full SeriesSpec, which
+    holds dicts and sets and so cannot be used as a cache key.
+
+    Args:
+        base_series: Base series name (e.g., 'GCM155')
+        capacitance: Capacitance value in Farads
+
+    Returns:
+        Appropriate characteristic code for the series/value combination
+
+    Raises:
+        ValueError: If base_series is not a supported series
+    """
+    if base_series not in CHARACTERISTIC_CONFIGS:
+        raise ValueError(f"Unknown series: {base_series}")
 
-    thresholds = CHARACTERISTIC_CONFIGS[specs.base_series]
+    thresholds = CHARACTERISTIC_CONFIGS[base_series]
 
     for threshold in thresholds:
         if capacitance > threshold.threshold:
@@ -200,7 +241,7 @@ def generate_standard_values(
     min_value: float,
     max_value: float,
     excluded_values: Set[float]
-) -> Iterator[float]:
+) -> np.ndarray:
     """Generate standard E12 series capacitance values within range.
 
     Args:
@@ -208,31 +249,28 @@ def generate_standard_values(
         max_value: Maximum capacitance in Farads
         excluded_values: Set of values to exclude from output
 
-    Yields:
-        float:
+    Returns:
+        np.ndarray:
             Standard E12 series values between min and max,
-            excluding specified values
+            excluding specified values, in ascending order
 
     Note:
         Values are normalized to avoid floating point precision issues.
         The function uses the E12 series multipliers:
             1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2
     """
-    e12_multipliers: Final[List[float]] = [
-        1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2
-    ]
-
     # Convert excluded values to normalized form
-    normalized_excluded = {float(f"{value:.1e}") for value in excluded_values}
+    normalized_excluded = [float(f"{value:.1e}") for value in excluded_values]
+
+    # One row per decade from 1pF up to the decade holding max_value
+    top_decade = int(np.floor(np.log10(max_value)))
+    decades = np.logspace(-12, top_decade, top_decade + 13)
+    grid = np.outer(decades, E12_MULTIPLIERS).ravel()
+    grid = np.char.mod('%.1e', grid).astype(np.float64)
 
-    decade = 1.0e-12
-    while decade <= max_value:
-        for multiplier in e12_multipliers:
-            normalized_value = float(f"{decade * multiplier:.1e}")
-            if min_value <= normalized_value <= max_value:
-                if normalized_value not in normalized_excluded:
-                    yield normalized_value
-        decade *= 10
+    mask = (grid >= min_value) & (grid <= max_value)
+    mask &= ~np.isin(grid, normalized_excluded)
+    return grid[mask]
 
 
 def generate_datasheet_url(mpn: str, specs: ssc.SeriesSpec) -> str:
@@ -262,87 +300,104 @@ def create_part_info(params: PartParameters) -> ssc.PartInfo:
     Returns:
         PartInfo containing all component information and identifiers
     """
-    capacitance_code = generate_capacitance_code(params.capacitance)
-    characteristic_code = get_characteristic_code(
-        params.capacitance,
-        params.specs
-    )
+    specs = params.specs
+    characteristic_code = get_characteristic_code(params.capacitance, specs)
     formatted_value = format_capacitance_value(params.capacitance)
 
-    mpn = (
-        f"{params.specs.base_series}"
-        f"{params.specs.dielectric_code[params.series_type]}"
-        f"{params.specs.voltage_code}"
-        f"{capacitance_code}"
-        f"{params.tolerance_code}"
-        f"{characteristic_code}"
-        f"{params.packaging}"
-    )
+    # Single C-level concatenation of the MPN components, in order
+    mpn = ''.join((
+        specs.base_series,
+        params.dielectric_code,
+        specs.voltage_code,
+        params.capacitance_code,
+        params.tolerance_code,
+        characteristic_code,
+        params.packaging
+    ))
 
     symbol_name = f"C_{mpn}"
     description = (
         f"CAP SMD {formatted_value} "
-        f"{params.series_type.value} {params.tolerance_value} "
-        f"{params.specs.case_code_in} {params.specs.voltage_rating}"
+        f"{params.dielectric} {params.tolerance_value} "
+        f"{specs.case_code_in} {specs.voltage_rating}"
     )
-    trustedparts_link = f"{params.specs.trustedparts_url}/{mpn}"
-    datasheet_url = generate_datasheet_url(mpn, params.specs)
+    trustedparts_link = f"{specs.trustedparts_url}/{mpn}"
+    datasheet_url = generate_datasheet_url(mpn, specs)
 
     return ssc.PartInfo(
         symbol_name=symbol_name,
         reference="C",
         value=params.capacitance,
         formatted_value=formatted_value,
-        footprint=params.specs.footprint,
+        footprint=specs.footprint,
         datasheet=datasheet_url,
         description=description,
-        manufacturer=params.specs.manufacturer,
+        manufacturer=specs.manufacturer,
         mpn=mpn,
-        dielectric=params.series_type.value,
+        dielectric=params.dielectric,
         tolerance=params.tolerance_value,
-        voltage_rating=params.specs.voltage_rating,
-        case_code_in=params.specs.case_code_in,
-        case_code_mm=params.specs.case_code_mm,
-        series=params.specs.base_series,
+        voltage_rating=specs.voltage_rating,
+        case_code_in=specs.case_code_in,
+        case_code_mm=specs.case_code_mm,
+        series=specs.base_series,
         trustedparts_link=trustedparts_link
     )
 
 
-def generate_part_numbers(specs: ssc.SeriesSpec) -> List[ssc.PartInfo]:
+def generate_part_numbers(specs: ssc.SeriesSpec) -> Iterator[ssc.PartInfo]:
     """Generate all valid part numbers for a series specification.
 
+    Parts are yielded already ordered by dielectric type and capacitance
+    value: dielectrics are visited in name order and the standard values
+    come out ascending, so no separate sort pass is needed.
+
     Args:
         specs: Complete series specifications
 
-    Returns:
-        List of PartInfo objects for all valid component combinations,
-        sorted by dielectric type and capacitance value
+    Yields:
+        PartInfo objects for all valid component combinations,
+        ordered by dielectric type and capacitance value
     """
-    parts_list: List[ssc.PartInfo] = []
+    # Bound once so the inner loop skips the global lookups
+    make_part = create_part_info
+    make_params = PartParameters
 
-    for series_type in ssc.SeriesType:
+    for series_type in sorted(ssc.SeriesType, key=lambda x: x.value):
         if series_type in specs.value_range:
             min_val, max_val = specs.value_range[series_type]
 
-            for capacitance in generate_standard_values(
+            capacitances = generate_standard_values(
                 min_val,
                 max_val,
                 specs.excluded_values
-            ):
-                for tolerance_code, tolerance_value in \
-                        specs.tolerance_map[series_type].items():
-                    for packaging in specs.packaging_options:
-                        params = PartParameters(
-                            capacitance=capacitance,
-                            tolerance_code=tolerance_code,
-                            tolerance_value=tolerance_value,
-                            packaging=packaging,
-                            series_type=series_type,
-                            specs=specs
-                        )
-                        parts_list.append(create_part_info(params))
-
-    return sorted(parts_list, key=lambda x: (x.dielectric, x.value))
+            )
+            capacitance_codes = generate_capacitance_codes(capacitances)
+
+            # Resolved once per dielectric rather than once per part
+            dielectric = series_type.value
+            dielectric_code = specs.dielectric_code[series_type]
+
+            suffixes = [
+                (tolerance_code, tolerance_value, packaging)
+                for tolerance_code, tolerance_value in
+                specs.tolerance_map[series_type].items()
+                for packaging in specs.packaging_options
+            ]
+
+            for capacitance, capacitance_code in zip(
+                    capacitances.tolist(), capacitance_codes):
+                for tolerance_code, tolerance_value, packaging in suffixes:
+                    params = make_params(
+                        capacitance=capacitance,
+                        capacitance_code=capacitance_code,
+                        tolerance_code=tolerance_code,
+                        tolerance_value=tolerance_value,
+                        packaging=packaging,
+                        dielectric=dielectric,
+                        dielectric_code=dielectric_code,
+                        specs=specs
+                    )
+                    yield make_part(params)
 
 
 # Global header to attribute mapping
@@ -394,22 +449,18 @@ def generate_files_for_series(
     symbol_filename = f"CAPACITORS_{series_code}_DATA_BASE.kicad_sym"
 
     # Generate part numbers and write to CSV
-    parts_list = generate_part_numbers(specs)
+    parts_list = list(generate_part_numbers(specs))
     utils.write_to_csv(parts_list, csv_filename, HEADER_MAPPING)
     print_success(
         f"Generated {len(parts_list)} part numbers in '{csv_filename}'")
 
-    # Generate KiCad symbol file
+    # Generate KiCad symbol file from the in-memory parts
     try:
-        ki_csg.generate_kicad_symbol(
-            f'data/{csv_filename}',
+        ki_csg.generate_kicad_symbol_from_records(
+            utils.parts_to_records(parts_list, HEADER_MAPPING),
             f'series_kicad_sym/{symbol_filename}')
         print_success(
             f"KiCad symbol file '{symbol_filename}' generated successfully.")
-    except FileNotFoundError as file_error:
-        print_error(f"CSV file not found: {file_error}")
-    except csv.Error as csv_error:
-        print_error(f"CSV processing error: {csv_error}")
     except IOError as io_error:
         print_error(f"I/O error when generating KiCad symbol file: {io_error}")
 
@@ -445,15 +496,12 @@ def generate_unified_files(
     print_success(
         f"Generated unified CSV file with {len(all_parts)} part numbers")
 
-    # Generate unified KiCad symbol file
+    # Generate unified KiCad symbol file from the in-memory parts
     try:
-        ki_csg.generate_kicad_symbol(
-            f'data/{unified_csv}', f'symbols/{unified_symbol}')
+        ki_csg.generate_kicad_symbol_from_records(
+            utils.parts_to_records(all_parts, HEADER_MAPPING),
+            f'symbols/{unified_symbol}')
         print_success("Unified KiCad symbol file generated successfully.")
-    except FileNotFoundError as file_error:
-        print_error(f"Unified CSV file not found: {file_error}")
-    except csv.Error as csv_error:
-        print_error(f"CSV processing error for unified file: {csv_error}")
     except IOError as io_error:
         print_error(
             f"I/O error when generating unified KiCad symbol file: {io_error}")
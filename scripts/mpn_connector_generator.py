@@ -76,16 +76,16 @@ def generate_footprints_for_series(parts_list: List[ssc.PartInfo]) -> None:
     """Generate footprint files for all parts in a series."""
     os.makedirs("connector_footprints.pretty", exist_ok=True)
 
-    for part in parts_list:
-        try:
-            kco_fg.generate_footprint_file(part)
-            print_success(
-                f"Generated footprint file for {part.mpn}"
-            )
-        except ValueError as e:
-            print_error(f"Error generating footprint: {e}")
-        except IOError as e:
-            print_error(f"I/O error generating footprint: {e}")
+    failures = kco_fg.generate_footprint_files(parts_list)
+    for mpn, error in failures:
+        if isinstance(error, ValueError):
+            print_error(f"Error generating footprint for {mpn}: {error}")
+        else:
+            print_error(f"I/O error generating footprint for {mpn}: {error}")
+
+    print_success(
+        f"Generated {len(parts_list) - len(failures)} footprint files"
+    )
 
 
 def generate_files_for_series(
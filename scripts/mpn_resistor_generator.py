@@ -19,8 +19,12 @@ Features:
 - Exports in industry-standard formats (CSV, KiCad)
 """
 
+import os
 import csv
-from typing import List, Final, Iterator
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Final, Iterator, Optional
 from colorama import init, Fore, Style
 import kicad_resistor_symbol_generator as ki_rsg
 import series_specs_resistors as ssr
@@ -61,6 +65,7 @@ E24_BASE_VALUES: Final[List[float]] = [
 ]
 
 
+@lru_cache(maxsize=None)
 def format_resistance_value(resistance: float) -> str:
     """
     Convert a resistance value to a human-readable string format.
@@ -81,6 +86,7 @@ def format_resistance_value(resistance: float) -> str:
     return f"{clean_number(resistance)} Ω"
 
 
+@lru_cache(maxsize=None)
 def generate_resistance_code(resistance: float, max_resistance: int) -> str:
     """
     Generate the resistance code portion of a Panasonic part number.
@@ -115,22 +121,13 @@ def generate_resistance_code(resistance: float, max_resistance: int) -> str:
         decimal = int(round((resistance - whole) * 10))
         return f"{whole:02d}R{decimal}"
 
-    # For values ≥ 100Ω, determine multiplier and significant digits
-    if resistance < 1000:  # 100-999Ω
-        significant = int(round(resistance))
-        multiplier = "0"
-    elif resistance < 10000:  # 1k-9.99kΩ
-        significant = int(round(resistance / 10))
-        multiplier = "1"
-    elif resistance < 100000:  # 10k-99.9kΩ
-        significant = int(round(resistance / 100))
-        multiplier = "2"
-    elif resistance < 1000000:  # 100k-999kΩ
-        significant = int(round(resistance / 1000))
-        multiplier = "3"
-    else:  # 1MΩ+
-        significant = int(round(resistance / 10000))
-        multiplier = "4"
+    # For values ≥ 100Ω, the multiplier digit is the decade minus two,
+    # capped at 4 (×10000) for 1MΩ and above
+    decade = int(math.log10(resistance))
+    if resistance < 10 ** decade:  # log10 can round up just below a decade
+        decade -= 1
+    multiplier = min(decade - 2, 4)
+    significant = int(round(resistance / 10 ** multiplier))
 
     return f"{significant:03d}{multiplier}"
 
@@ -226,30 +223,44 @@ def generate_part_numbers(specs: ssr.SeriesSpec) -> List[ssr.PartInfo]:
         List of PartInfo instances for all valid combinations
     """
     parts_list: List[ssr.PartInfo] = []
+    # Bound once so the inner loop skips the attribute and global lookups
+    append_part = parts_list.append
+    make_part = create_part_info
+
+    # Special case for high resistance values, shared by both series types
+    high_suffixes = [
+        (tolerance_code, tolerance_value, packaging)
+        for tolerance_code, tolerance_value in
+        (specs.high_resistance_tolerance or {}).items()
+        for packaging in specs.packaging_options
+    ]
 
     for series_type in ssr.SeriesType:
         base_values = (
             E96_BASE_VALUES if series_type == ssr.SeriesType.E96
             else E24_BASE_VALUES
         )
+        normal_suffixes = [
+            (tolerance_code, tolerance_value, packaging)
+            for tolerance_code, tolerance_value in
+            specs.tolerance_map[series_type].items()
+            for packaging in specs.packaging_options
+        ]
 
         for resistance in generate_resistance_values(
                 base_values, specs.max_resistance):
-            # Handle special case for high resistance values
-            if resistance > 1_000_000 and specs.high_resistance_tolerance:
-                tolerance_codes = specs.high_resistance_tolerance
-            else:
-                tolerance_codes = specs.tolerance_map[series_type]
-
-            for tolerance_code, tolerance_value in tolerance_codes.items():
-                for packaging in specs.packaging_options:
-                    parts_list.append(create_part_info(
-                        resistance,
-                        tolerance_code,
-                        tolerance_value,
-                        packaging,
-                        specs
-                    ))
+            suffixes = (
+                high_suffixes if resistance > 1_000_000 and high_suffixes
+                else normal_suffixes
+            )
+            for tolerance_code, tolerance_value, packaging in suffixes:
+                append_part(make_part(
+                    resistance,
+                    tolerance_code,
+                    tolerance_value,
+                    packaging,
+                    specs
+                ))
 
     return parts_list
 
@@ -275,19 +286,26 @@ HEADER_MAPPING: Final[dict] = {
 
 def generate_files_for_series(
     series_name: str,
-    unified_parts_list: List[ssr.PartInfo]
-) -> None:
+    unified_parts_list: Optional[List[ssr.PartInfo]] = None
+) -> List[ssr.PartInfo]:
     """
     Generate CSV and KiCad symbol files for a specific resistor series.
 
     Creates:
     1. A CSV file containing all component specifications
     2. A KiCad symbol file for use in electronic design
-    3. Adds generated parts to the unified parts list
+    3. Adds generated parts to the unified parts list, if one is given
+
+    Series write disjoint output files, so this function can run in a
+    separate worker process for each series.
 
     Args:
         series_name: Name of the resistor series (e.g., 'ERJ-2RK')
-        unified_parts_list: List to store generated parts for unified database
+        unified_parts_list: Optional list to store generated parts for
+            the unified database
+
+    Returns:
+        List of PartInfo instances generated for the series
 
     Raises:
         ValueError: If series_name is not recognized
@@ -298,6 +316,8 @@ def generate_files_for_series(
     if series_name not in ssr.SERIES_SPECS:
         raise ValueError(f"Unknown series: {series_name}")
 
+    print_info(f"\nGenerating files for {series_name} series:")
+
     specs = ssr.SERIES_SPECS[series_name]
     series_code = series_name.replace("-", "")
     csv_filename = f"{series_code}_part_numbers.csv"
@@ -324,7 +344,10 @@ def generate_files_for_series(
         print_error(f"I/O error when generating KiCad symbol file: {io_error}")
 
     # Add parts to unified list
-    unified_parts_list.extend(parts_list)
+    if unified_parts_list is not None:
+        unified_parts_list.extend(parts_list)
+
+    return parts_list
 
 
 def generate_unified_files(
@@ -374,9 +397,12 @@ if __name__ == "__main__":
     try:
         unified_parts: List[ssr.PartInfo] = []
 
-        for series in ssr.SERIES_SPECS:
-            print_info(f"\nGenerating files for {series} series:")
-            generate_files_for_series(series, unified_parts)
+        # Each series is independent, so generate them in parallel and
+        # collect the results in SERIES_SPECS order for the unified files
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for series_parts in executor.map(
+                    generate_files_for_series, ssr.SERIES_SPECS):
+                unified_parts.extend(series_parts)
 
         # Generate unified files after all series are processed
         UNIFIED_CSV = "UNITED_RESISTORS_DATA_BASE.csv"